@@ -1 +1,22 @@
-from .testing import param, parametrize
+import importlib
+
+__all__ = ["param", "parametrize"]
+
+_SUBMODULES = ("ffmpy", "querylist", "testing")
+
+
+def __getattr__(name):
+    # redbreast.testing imports pytest, which is slow. Only import it when it's actually used, so
+    # that e.g. the ffmpy CLI doesn't have to pay for it.
+    if name in __all__:
+        from . import testing
+
+        return getattr(testing, name)
+    # `import redbreast; redbreast.testing...` should keep working without an explicit import.
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, *_SUBMODULES})
@@ -1,8 +1,17 @@
-from . import cli
+import os
+import sys
 
 
 def main():
-    cli.app(prog_name="ffmpy")
+    # The typer app is nicer (e.g. shell completion) but much slower to start up, so it's opt-in.
+    if os.environ.get("FFMPY_TYPER") == "1":
+        from . import cli
+
+        cli.app(prog_name="ffmpy")
+    else:
+        from . import argparse_cli
+
+        sys.exit(argparse_cli.main())
 
 
 if __name__ == "__main__":
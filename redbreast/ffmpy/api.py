@@ -1,31 +1,108 @@
-import shlex
+import os
+import stat
 import subprocess
+import sys
 from pathlib import Path
+from typing import Literal, Optional
+
+# Input options that stop ffmpeg from spending seconds probing the input before it starts
+# encoding. These have to go before the "-i" flag.
+FAST_START_ARGS = ["-probesize", "32", "-analyzeduration", "0", "-fflags", "+nobuffer"]
+
+# Ways of sampling frames for a timelapse. See `_frame_sampling_args`.
+TimelapseMode = Literal["filter", "select", "keyframe"]
+
+# How much of the end of ffmpeg's stderr to keep for the FfmpegError message
+STDERR_TAIL_SIZE = 4096
 
 
 class FfmpegError(Exception):
     pass
 
 
+class BatchError(Exception):
+    """Raised by batch_to_mp4 when some of the conversions failed. `errors` maps each input that
+    failed to the exception it raised."""
+
+    def __init__(self, errors: dict[str, Exception]):
+        self.errors = errors
+        lines = [f"{video}: {e.__class__.__name__}: {e}" for video, e in errors.items()]
+        super().__init__(f"Failed to convert {len(errors)} file(s):\n" + "\n".join(lines))
+
+
 def _resolve_file(path: str) -> Path:
-    path = Path(path).resolve()
-    if not (path.exists() and path.is_file()):
-        raise FileNotFoundError(path.as_posix())
-    return path
+    """Check that the path points to a file, with a single stat call. The path is made absolute
+    (which, unlike resolve(), doesn't follow symlinks), so the output paths built from it are
+    absolute too, and none of the paths given to ffmpeg can be mistaken for an option, e.g.
+    "-clip.mkv"."""
+    try:
+        is_file = stat.S_ISREG(os.stat(path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):  # the latter if a parent is a file
+        is_file = False
+    if not is_file:
+        raise FileNotFoundError(path)
+    return Path(path).absolute()
 
 
-def _run_ffmpeg(cmd: str):
-    """Unpack command into subprocess. Handle errors."""
-    process = subprocess.run(shlex.split(cmd))
+def _run_ffmpeg(args: list[str]):
+    """
+    Pass the argument list straight to subprocess. Handle errors.
+
+    ffmpeg's stderr (its progress, and any error message) is passed on to our stderr as it arrives,
+    and only the end of it is kept for the FfmpegError. It's handled as bytes, because ffmpeg
+    echoes the input's metadata tags, which aren't necessarily valid UTF-8.
+    """
+    tail = b""
+    with subprocess.Popen(args, stderr=subprocess.PIPE) as process:
+        while chunk := process.stderr.read1(STDERR_TAIL_SIZE):
+            _write_stderr(chunk)
+            tail = (tail + chunk)[-STDERR_TAIL_SIZE:]
     if process.returncode:
-        raise FfmpegError(f"{process.stderr}")
+        raise FfmpegError(tail.decode(errors="replace"))
+
+
+def _write_stderr(chunk: bytes):
+    """Write raw bytes to stderr, if it's a real stream; otherwise write them as text."""
+    buffer = getattr(sys.stderr, "buffer", None)
+    if buffer is None:
+        sys.stderr.write(chunk.decode(errors="replace"))
+        return
+    buffer.write(chunk)
+    buffer.flush()
+
+
+def _frame_sampling_args(
+    mode: TimelapseMode, step: int, input_fps: int
+) -> tuple[list[str], list[str]]:
+    """
+    Get the (input, output) ffmpeg args that sample the frames of a timelapse:
+
+    - "filter": decode every frame and keep every step-th one with the framestep filter.
+    - "select": same sampling using the select filter, which drops the other frames earlier in
+      the pipeline.
+    - "keyframe": tell the decoder to skip everything except keyframes. This is the fastest, but
+      the sampling interval is then the keyframe interval of the input, and `step` is ignored.
+    """
+    setpts = f"setpts=N/{input_fps}/TB"  # space the frames at the INPUT video FPS
+    match mode:
+        case "filter":
+            return [], ["-vf", f"framestep={step},{setpts}"]
+        case "select":
+            return [], ["-vf", f"select='not(mod(n,{step}))',{setpts}", "-vsync", "vfr"]
+        case "keyframe":
+            return ["-skip_frame", "nokey"], ["-vf", setpts, "-vsync", "vfr"]
+        case _:
+            raise ValueError(f"Unknown timelapse mode: {mode!r}")
 
 
 def create_timelapse(
-    input_video: str,  # absolute path to the input video
+    input_video: str,  # path to the input video
     step,  # every step-th frame will be sampled from the input video
     input_fps,  # FPS of the input video
     output_fps=60,  # FPS of the output video
+    fast_start: bool = True,  # skip most of ffmpeg's input probing
+    preset: str = "ultrafast",  # libx264 preset; slower presets give smaller files
+    mode: TimelapseMode = "filter",  # how to sample the frames
 ) -> str:
     """
     Create a timelapse (sped up) video from a really long normal speed video.
@@ -33,30 +110,92 @@ def create_timelapse(
     input_video = _resolve_file(input_video)
     output_filename = input_video.stem + "_timelapse" + input_video.suffix
     output_video = input_video.parent / output_filename
-    cmd = (
-        f"ffmpeg"
-        f" -an"  # ignore input file audio
-        f" -i {input_video.as_posix()}"
-        f" -vf framestep={step},"  # sample the input video every 'framestep' frames
-        f"setpts=N/{input_fps}/TB"  # space the frames at the INPUT video FPS
-        f" -r {output_fps}"  # specify output video FPS again?
-        f" -y"  # force overwrite
-        f" {output_video.as_posix()}"
-    )
-    _run_ffmpeg(cmd)
+    input_args, sampling_args = _frame_sampling_args(mode, step, input_fps)
+    args = [
+        "ffmpeg",
+        "-an",  # ignore input file audio
+        *(FAST_START_ARGS if fast_start else []),
+        *input_args,
+        "-i",
+        input_video.as_posix(),
+        *sampling_args,
+        "-r",  # specify output video FPS again?
+        str(output_fps),
+        "-c:v",
+        "libx264",
+        "-preset",
+        preset,
+        "-threads",  # let ffmpeg pick the number of threads
+        "0",
+        "-y",  # force overwrite
+        output_video.as_posix(),
+    ]
+    _run_ffmpeg(args)
     return output_video.as_posix()
 
 
-def to_mp4(input_video: str) -> str:
+def _mp4_output_path(input_video: Path) -> Path:
+    return input_video.parent / (input_video.stem + ".mp4")
+
+
+def to_mp4(input_video: str, fast_start: bool = True) -> str:
     """Not sure why I wrote a function just for this. Apparently it was important enough though."""
     input_video = _resolve_file(input_video)
-    output_video = input_video.parent / (input_video.stem + ".mp4")
-    cmd = (
-        "ffmpeg"
-        f" -i {input_video.as_posix()}"
-        f" -vcodec copy"
-        f" -y "  # force overwrite
-        f" {output_video.as_posix()}"
-    )
-    _run_ffmpeg(cmd)
+    output_video = _mp4_output_path(input_video)
+    args = [
+        "ffmpeg",
+        *(FAST_START_ARGS if fast_start else []),
+        "-i",
+        input_video.as_posix(),
+        "-vcodec",
+        "copy",
+        "-y",  # force overwrite
+        output_video.as_posix(),
+    ]
+    _run_ffmpeg(args)
     return output_video.as_posix()
+
+
+def batch_to_mp4(
+    input_videos: list[str],
+    max_workers: Optional[int] = None,
+    fast_start: bool = True,
+) -> list[str]:
+    """
+    Convert several videos to mp4 concurrently. Returns the output paths in the same order as the
+    inputs.
+
+    The heavy lifting happens in the ffmpeg child processes, so threads are enough to keep several
+    of them running at once. ffmpeg is multithreaded itself, so by default we only run about a
+    quarter as many jobs as there are cores.
+    """
+    # only needed here, and slow to import, so it's not imported at the top of the module
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Inputs with the same stem (e.g. a.mkv and a.avi) would have two ffmpeg processes writing to
+    # the same output file at once, so refuse to start any of them.
+    inputs_by_output = {}
+    for video in input_videos:
+        output_video = _mp4_output_path(Path(video).absolute())
+        inputs_by_output.setdefault(output_video, []).append(video)
+    if collisions := [inputs for inputs in inputs_by_output.values() if len(inputs) > 1]:
+        raise ValueError(
+            "These inputs would be converted to the same file: "
+            + "; ".join(", ".join(inputs) for inputs in collisions)
+        )
+
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(to_mp4, video, fast_start=fast_start) for video in input_videos]
+
+    # the executor has waited for all the jobs, so report every input that failed, not just the
+    # first one.
+    errors = {
+        video: future.exception()
+        for video, future in zip(input_videos, futures)
+        if future.exception() is not None
+    }
+    if errors:
+        raise BatchError(errors)
+    return [future.result() for future in futures]
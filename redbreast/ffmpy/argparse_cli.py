@@ -0,0 +1,154 @@
+"""
+Stdlib-only version of the ffmpy CLI. It has the same commands and options as the typer app in
+`cli.py`, but skips the cost of importing typer/click, which is most of the runtime for a command
+this small. The typer app is still available (e.g. for shell completion) by setting FFMPY_TYPER=1.
+"""
+
+import argparse
+import sys
+from typing import Optional, get_args
+
+from . import api
+
+FAST_START_HELP = (
+    "Skip most of ffmpeg's input probing to cut startup time. "
+    "Disable this if ffmpeg can't make sense of the input file."
+)
+
+RED = "\033[31m"
+GREEN = "\033[32m"
+ON_RED = "\033[41m"
+RESET = "\033[0m"
+
+
+def _secho(message: str, colour: str):
+    # only use colours in a terminal, like typer.secho does
+    print(f"{colour}{message}{RESET}" if sys.stdout.isatty() else message)
+
+
+def format_error(e: Exception) -> str:
+    match e:
+        case FileNotFoundError():
+            return f"File not found: {e}"
+        case api.FfmpegError():
+            return f"ffmpeg gave an error: {e}"
+        case api.BatchError():
+            return str(e)  # already lists each input and its error
+        case _:
+            return f"{e.__class__.__name__}: {e}"
+
+
+def _step(value: str) -> int:
+    """argparse type for --step, so that a bad value is reported with the timelapse usage"""
+    try:
+        step = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if step < 2:
+        raise argparse.ArgumentTypeError("must be at least 2")
+    return step
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="ffmpy")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    timelapse = commands.add_parser(
+        "timelapse",
+        help="Create a timelapse (sped up) video from a very long normal-speed video.",
+    )
+    timelapse.add_argument("--input-file", "-i", required=True)
+    timelapse.add_argument(
+        "--step",
+        "-s",
+        type=_step,
+        default=10,
+        help="Every sth frame will be sampled from the input video.",
+    )
+    timelapse.add_argument(
+        "--input-fps", "-ifps", type=int, required=True, help="FPS of the input video file"
+    )
+    timelapse.add_argument(
+        "--output-fps", "-ofps", type=int, default=60, help="Desired FPS of the output video file"
+    )
+    timelapse.add_argument(
+        "--preset",
+        "-p",
+        default="ultrafast",
+        help="libx264 preset. Slower presets take longer but give smaller files.",
+    )
+    timelapse.add_argument(
+        "--mode",
+        "-m",
+        default="filter",
+        choices=get_args(api.TimelapseMode),
+        help=(
+            "How to sample frames: 'filter' (framestep), 'select' (drops frames earlier), or "
+            "'keyframe' (only decodes keyframes; ignores --step)."
+        ),
+    )
+    timelapse.add_argument(
+        "--fast-start", action=argparse.BooleanOptionalAction, default=True, help=FAST_START_HELP
+    )
+
+    to_mp4 = commands.add_parser("to-mp4", help="Convert one or more video files to mp4.")
+    to_mp4.add_argument(
+        "--input-file",
+        "-i",
+        dest="input_files",
+        action="append",
+        required=True,
+        help="Can be given multiple times to convert several files concurrently.",
+    )
+    to_mp4.add_argument(
+        "--max-workers",
+        "-w",
+        type=int,
+        default=None,
+        help="Maximum number of ffmpeg processes to run at once.",
+    )
+    to_mp4.add_argument(
+        "--fast-start", action=argparse.BooleanOptionalAction, default=True, help=FAST_START_HELP
+    )
+
+    hello = commands.add_parser("hello", help="Hello, world!")
+    hello.add_argument("--name", default="World", help="Name of the person to greet")
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "hello":
+        _secho(f"Hello, {args.name}!", GREEN + ON_RED)
+        return 0
+
+    try:
+        match args.command:
+            case "timelapse":
+                output_files = [
+                    api.create_timelapse(
+                        input_video=args.input_file,
+                        step=args.step,
+                        input_fps=args.input_fps,
+                        output_fps=args.output_fps,
+                        fast_start=args.fast_start,
+                        preset=args.preset,
+                        mode=args.mode,
+                    )
+                ]
+            case "to-mp4":
+                if len(args.input_files) == 1:
+                    output_files = [api.to_mp4(args.input_files[0], fast_start=args.fast_start)]
+                else:
+                    output_files = api.batch_to_mp4(
+                        args.input_files, max_workers=args.max_workers, fast_start=args.fast_start
+                    )
+    except Exception as e:
+        _secho(format_error(e), RED)
+        return 1
+
+    for output_file in output_files:
+        _secho(f"Created file: {output_file}", GREEN)
+    return 0
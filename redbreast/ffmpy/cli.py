@@ -1,8 +1,10 @@
 from contextlib import contextmanager
+from typing import Optional
 
 import typer
 
 from . import api
+from .argparse_cli import FAST_START_HELP, format_error
 
 app = typer.Typer()
 
@@ -12,13 +14,7 @@ def _handle_errors():
     try:
         yield  # allow code inside the "with" statement to run
     except Exception as e:
-        match e:
-            case FileNotFoundError():
-                typer.secho(f"File not found: {e}", fg=typer.colors.RED)
-            case api.FfmpegError():
-                typer.secho(f"ffmpeg gave an error: {e}", fg=typer.colors.RED)
-            case _:
-                typer.secho(f"{e.__class__.__name__}: {e}", fg=typer.colors.RED)
+        typer.secho(format_error(e), fg=typer.colors.RED)
         raise typer.Exit(1)
 
 
@@ -48,6 +44,26 @@ def timelapse(
         "-ofps",
         help="Desired FPS of the output video file",
     ),
+    preset: str = typer.Option(
+        "ultrafast",
+        "--preset",
+        "-p",
+        help="libx264 preset. Slower presets take longer but give smaller files.",
+    ),
+    mode: str = typer.Option(
+        "filter",
+        "--mode",
+        "-m",
+        help=(
+            "How to sample frames: 'filter' (framestep), 'select' (drops frames earlier), or "
+            "'keyframe' (only decodes keyframes; ignores --step)."
+        ),
+    ),
+    fast_start: bool = typer.Option(
+        True,
+        "--fast-start/--no-fast-start",
+        help=FAST_START_HELP,
+    ),
 ):
     with _handle_errors():
         output_file = api.create_timelapse(
@@ -55,6 +71,9 @@ def timelapse(
             step=step,
             input_fps=input_fps,
             output_fps=output_fps,
+            fast_start=fast_start,
+            preset=preset,
+            mode=mode,
         )
     typer.secho(
         f"Created file: {output_file}",
@@ -62,17 +81,35 @@ def timelapse(
     )
 
 
-@app.command(name="to-mp4")
+@app.command(name="to-mp4", help="Convert one or more video files to mp4.")
 def to_mp4(
-    input_file: str = typer.Option(
+    input_files: list[str] = typer.Option(
         ...,
         "--input-file",
         "-i",
+        help="Can be given multiple times to convert several files concurrently.",
+    ),
+    max_workers: Optional[int] = typer.Option(
+        None,
+        "--max-workers",
+        "-w",
+        help="Maximum number of ffmpeg processes to run at once.",
+    ),
+    fast_start: bool = typer.Option(
+        True,
+        "--fast-start/--no-fast-start",
+        help=FAST_START_HELP,
     ),
 ):
     with _handle_errors():
-        output_file = api.to_mp4(input_file)
-    typer.secho(f"Created file: {output_file}", fg=typer.colors.GREEN)
+        if len(input_files) == 1:
+            output_files = [api.to_mp4(input_files[0], fast_start=fast_start)]
+        else:
+            output_files = api.batch_to_mp4(
+                input_files, max_workers=max_workers, fast_start=fast_start
+            )
+    for output_file in output_files:
+        typer.secho(f"Created file: {output_file}", fg=typer.colors.GREEN)
 
 
 @app.command(help="Hello, world!")
@@ -1,8 +1,63 @@
 import operator
-from copy import deepcopy
-from typing import Callable, Any
+from functools import cmp_to_key
+from typing import Callable, Any, Optional
 
-from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned
+# sentinel for `get`, because None is a perfectly valid item in a QueryList
+_NOT_FOUND = object()
+
+
+def _is_in(a, b) -> bool:
+    try:
+        return a in b
+    except TypeError:
+        # If `b` is a frozenset made by _as_membership_target, `a` is just unhashable, so fall back
+        # to the scan the original list/tuple would have done. Anything else is a genuine error.
+        if not isinstance(b, frozenset):
+            raise
+        return any(a == member for member in b)
+
+
+def _as_membership_target(value: Any) -> Any:
+    """
+    Convert the list/tuple value of an __in query to a frozenset once, so that checking each item
+    against it is a hash lookup instead of a scan. Strings are left alone (that's a substring
+    check), as are collections with unhashable members.
+    """
+    if isinstance(value, (list, tuple)):
+        try:
+            return frozenset(value)
+        except TypeError:
+            pass
+    return value
+
+
+class _RegistryCache:
+    """
+    Everything a QueryList class derives from its registries: dict versions of them, and the
+    parsed queries and chains that depend on them. It remembers which registry tuples it was built
+    from, so that it can be thrown away when the class' registries are replaced. That's checked by
+    identity, so the registered functions don't need to be hashable.
+    """
+
+    # parsed queries are cached until there are this many, then the cache starts over
+    max_size = 256
+
+    __slots__ = (
+        "operations",
+        "attribute_getters",
+        "operations_map",
+        "attribute_getters_map",
+        "queries",
+        "chains",
+    )
+
+    def __init__(self, operations: tuple, attribute_getters: tuple):
+        self.operations = operations
+        self.attribute_getters = attribute_getters
+        self.operations_map = dict(operations)
+        self.attribute_getters_map = dict(attribute_getters)
+        self.queries = {}
+        self.chains = {}
 
 
 class QueryList(list):
@@ -15,7 +70,7 @@ class QueryList(list):
         ("gt", operator.gt),
         ("gte", operator.ge),
         ("contains", operator.contains),
-        ("in", lambda a, b: a in b),
+        ("in", _is_in),
         ("len", lambda a, b: len(a) == b),
     )
 
@@ -32,69 +87,83 @@ class QueryList(list):
     )
 
     def all(self) -> list:
-        return list(deepcopy(self))
+        return list(self)
 
     def exists(self) -> bool:
         return bool(self)
 
     def first(self) -> Any:
-        return self[0] if self.exists() else None
+        return self[0] if self else None
 
     def last(self) -> Any:
-        return self[-1] if self.exists() else None
+        return self[-1] if self else None
 
     def count(self) -> int:
         return len(self)
 
     def filter(self, **kwargs) -> "QueryList":
-        func = lambda item: self._match_item(item, **kwargs)
-        return self.__class__(filter(func, self))
+        compiled = self._compile_search_terms(kwargs)
+        return self.__class__([item for item in self if self._match_compiled(item, compiled)])
+
+    def filter_many(self, *kwargs_list: dict) -> list["QueryList"]:
+        """
+        Apply several filters in a single pass over the items. Returns one QueryList per dict of
+        kwargs, so this is equivalent to `[self.filter(**kwargs) for kwargs in kwargs_list]`.
+        """
+        compiled = [self._compile_search_terms(kwargs) for kwargs in kwargs_list]
+        results = [[] for _ in compiled]
+        for item in self:
+            for search_terms, result in zip(compiled, results):
+                if self._match_compiled(item, search_terms):
+                    result.append(item)
+        return [self.__class__(result) for result in results]
 
     def exclude(self, **kwargs) -> "QueryList":
-        func = lambda item: not self._match_item(item, **kwargs)
-        return self.__class__(filter(func, self))
+        compiled = self._compile_search_terms(kwargs)
+        return self.__class__([item for item in self if not self._match_compiled(item, compiled)])
 
     def get(self, **kwargs) -> Any:
-        qs = self.filter(**kwargs)
-        if len(qs) == 0:
+        # importing django is slow, so only do it when someone actually uses get()
+        from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned
+
+        compiled = self._compile_search_terms(kwargs)
+        found = _NOT_FOUND
+        for item in self:
+            if self._match_compiled(item, compiled):
+                # no need to keep looking once we have a second match
+                if found is not _NOT_FOUND:
+                    raise MultipleObjectsReturned
+                found = item
+        if found is _NOT_FOUND:
             raise ObjectDoesNotExist
-        if len(qs) > 1:
-            raise MultipleObjectsReturned
-        return qs[0]
+        return found
 
     def order_by(self, *fields: str) -> "QueryList":
-        class comparer:
-            """
-            Thin wrapper around an item that allows us to reverse the sorting on a per-field
-            basis. Credit to black panda:
-            https://stackoverflow.com/questions/37693373/how-to-sort-a-list-with-two-keys-but-one-in-reverse-order
-            """
-
-            def __init__(self, value: Any, reverse: bool):
-                self.value = value
-                self.reverse = reverse
-
-            def __eq__(self, other):
-                return other.value == self.value
-
-            def __lt__(self, other):
-                if self.reverse:
-                    return other.value < self.value
-                else:
-                    return self.value < other.value
-
-        def comparison_func(item):
-            """Returns a tuple of attributes of the item which `sorted` will use to compare it
-            against its peers"""
-            return tuple(
-                comparer(
-                    self._recursive_get_attribute(item, field.lstrip("-")),
-                    reverse=field.startswith("-"),
-                )
-                for field in fields
-            )
-
-        return self.__class__(sorted(self, key=comparison_func))
+        # parse each field once, rather than once per item
+        chains = [self._parse_chain(field.lstrip("-")) for field in fields]
+        reverses = [field.startswith("-") for field in fields]
+
+        def get_values(item) -> tuple:
+            return tuple(self._follow_chain(item, chain) for chain in chains)
+
+        # Tuples compare lexicographically, so a field is only compared when all the fields before
+        # it are equal. If all the fields go in the same direction, the tuples of values can be
+        # compared directly without any Python-level comparison function.
+        if len(set(reverses)) <= 1:
+            return self.__class__(sorted(self, key=get_values, reverse=any(reverses)))
+
+        def compare(a: tuple, b: tuple) -> int:
+            for a_value, b_value, reverse in zip(a, b, reverses):
+                if a_value is b_value or a_value == b_value:
+                    continue
+                if reverse:
+                    a_value, b_value = b_value, a_value
+                return -1 if a_value < b_value else 1
+            return 0
+
+        # the values are still only fetched once per item; only the comparisons are Python-level
+        sort_key = cmp_to_key(compare)
+        return self.__class__(sorted(self, key=lambda item: sort_key(get_values(item))))
 
     @classmethod
     def register_operation(cls, name: str, function: Callable):
@@ -122,13 +191,93 @@ class QueryList(list):
         The item is one of the items in the QueryList.
         This function decides whether the item matches the search terms.
         """
-        for query, value in search_terms.items():
-            key, operation = cls._map_operation(query)
-            attribute = cls._recursive_get_attribute(item, key)
-            if not operation(attribute, value):
+        return cls._match_compiled(item, cls._compile_search_terms(search_terms))
+
+    @classmethod
+    def _match_compiled(cls, item: Any, compiled: list) -> bool:
+        """
+        Same as `_match_item`, but takes search terms that have already been parsed by
+        `_compile_search_terms`. This is what filter/exclude/get use in their loops, so that the
+        query strings are only parsed once per call instead of once per item.
+        """
+        for chain, operation, value in compiled:
+            if not operation(cls._follow_chain(item, chain), value):
                 return False
         return True
 
+    @classmethod
+    def _compile_search_terms(cls, search_terms: dict) -> list[tuple[tuple, Callable, Any]]:
+        """Parse each search term into (attribute chain, operation, value)"""
+        compiled = []
+        for query, value in search_terms.items():
+            chain, operation = cls._compile_query(query)
+            if operation is _is_in:
+                value = _as_membership_target(value)
+            compiled.append((chain, operation, value))
+        return compiled
+
+    @classmethod
+    def _get_registry_cache(cls) -> _RegistryCache:
+        """
+        Get the class' _RegistryCache, rebuilding it if the registries have been registered to,
+        reassigned or monkeypatched since it was built. Each class gets its own, because
+        subclasses can have different registries.
+        """
+        cache = cls.__dict__.get("_registry_cache")
+        if (
+            cache is None
+            or cache.operations is not cls.operations
+            or cache.attribute_getters is not cls.attribute_getters
+        ):
+            cache = cls._registry_cache = _RegistryCache(cls.operations, cls.attribute_getters)
+        return cache
+
+    @classmethod
+    def _compile_query(cls, query: str) -> tuple[tuple, Callable]:
+        """
+        Split a query parameter into the attribute chain (see `_parse_chain`) and the operation.
+        E.g. if query="name__len__lt" -> chain=((None, "name"), (len, "len")), operation=operator.lt
+
+        Like `_parse_chain`, this is cached, so each distinct query is only parsed once.
+        """
+        queries = cls._get_registry_cache().queries
+        compiled = queries.get(query)
+        if compiled is None:
+            key, operation = cls._map_operation(query)
+            compiled = (cls._parse_chain(key), operation)
+            if len(queries) >= _RegistryCache.max_size:
+                queries.clear()
+            queries[query] = compiled
+        return compiled
+
+    @classmethod
+    def _parse_chain(cls, query: str) -> tuple[tuple[Optional[Callable], str], ...]:
+        """
+        Split a query into a chain of (getter, name) steps. If `name` is a registered attribute
+        getter, `getter` is the corresponding function; otherwise it is None and `name` is looked
+        up on the item. The queries used in filter/order_by calls tend to come from a small fixed
+        set, so the result is cached.
+        """
+        cache = cls._get_registry_cache()
+        chain = cache.chains.get(query)
+        if chain is None:
+            getters = cache.attribute_getters_map
+            chain = tuple((getters.get(name), name) for name in query.split("__"))
+            if len(cache.chains) >= _RegistryCache.max_size:
+                cache.chains.clear()
+            cache.chains[query] = chain
+        return chain
+
+    @classmethod
+    def _follow_chain(cls, item: Any, chain: tuple) -> Any:
+        """Walk a chain from `_parse_chain` to get the value off the item"""
+        for getter, name in chain:
+            if getter is not None:
+                item = getter(item)
+            else:
+                item = cls._get_attribute(item, name)
+        return item
+
     @classmethod
     def _get_attribute(cls, item: Any, attribute: str) -> Any:
         """Get the value off an item with either ["dict key lookup"] or .dot_lookup"""
@@ -136,14 +285,7 @@ class QueryList(list):
 
     @classmethod
     def _recursive_get_attribute(cls, item: Any, query: str) -> Any:
-        attributes = query.split("__")
-        for attribute in attributes:
-            if attribute in dict(cls.attribute_getters):
-                func = dict(cls.attribute_getters)[attribute]
-                item = func(item)
-            else:
-                item = cls._get_attribute(item, attribute)
-        return item
+        return cls._follow_chain(item, cls._parse_chain(query))
 
     @classmethod
     def _map_operation(cls, query: str) -> tuple[str, Callable]:
@@ -163,7 +305,7 @@ class QueryList(list):
 
         if "__" in query:
             first_parts, dunder_operation = query.rsplit("__", maxsplit=1)
-            operations = dict(cls.operations)
+            operations = cls._get_registry_cache().operations_map
             if dunder_operation in operations:
                 operation = operations[dunder_operation]
                 key = first_parts
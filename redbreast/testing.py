@@ -1,11 +1,16 @@
 """Utility stuff for use in tests"""
 
 import operator
-import re
+import sys
+from functools import lru_cache
 from typing import Optional, Protocol, Sequence
 
 import pytest
 
+# bound once, rather than looked up on the operator module for every value compared
+_IS = operator.is_
+_EQ = operator.eq
+
 
 class TestParams(Protocol):
     """This is to help static type checkers detect the always-present "description" kwarg."""
@@ -21,6 +26,9 @@ class param:
     Shadows pytest.param, but the values go in the **kwargs, not the *args.
     """
 
+    # test suites can create lots of these, so skip the per-instance __dict__
+    __slots__ = ("marks", "id", "kwargs", "_values_cache")
+
     def __init__(
         self,
         *,  # force kwargs
@@ -29,8 +37,24 @@ class param:
         **kwargs,
     ):
         self.marks = marks
-        self.id = id
+        # interned, so that pytest's repeated comparisons of test ids can usually match by identity
+        self.id = sys.intern(id) if type(id) is str else id
         self.kwargs = kwargs
+        # values in argnames order, keyed by argnames. Saves re-checking the kwargs if the same
+        # param is used in several parametrize calls.
+        self._values_cache: dict[tuple[str, ...], tuple] = {}
+
+
+@lru_cache(maxsize=256)
+def _split_argnames(argnames: str) -> tuple[str, ...]:
+    """
+    Split "a, b" or "a,b" into ("a", "b"). The same argnames strings tend to be used over and
+    over in a test suite, so this is cached.
+
+    The names are interned so that the kwargs lookups can match the (already interned) keyword
+    names by identity. The strip handles stray whitespace, e.g. "a ,b" or " a, b ".
+    """
+    return tuple(sys.intern(name.strip()) for name in argnames.split(","))
 
 
 def parametrize(argnames: str | Sequence[str], params: Sequence[param], **kwargs):
@@ -42,26 +66,45 @@ def parametrize(argnames: str | Sequence[str], params: Sequence[param], **kwargs
     # convert argnames to a list of strings.
     # This dictates the order in which the values should appear.
     if isinstance(argnames, str):
-        argnames = re.split(", |,", argnames)  # match comma+space and comma
-    else:
+        argnames = list(_split_argnames(argnames))
+    elif not isinstance(argnames, list):
         argnames = list(argnames)
 
+    # Fetches the values from a param's kwargs in the order of argnames. itemgetter returns a bare
+    # value instead of a tuple if there is only one name, and can't be built with no names at all,
+    # so those cases are handled separately.
+    if not argnames:
+        get_values = lambda kwargs: ()
+    elif len(argnames) == 1:
+        get_values = lambda kwargs, name=argnames[0]: (kwargs[name],)
+    else:
+        get_values = operator.itemgetter(*argnames)
+
     # convert the list of redbreast.params into pytest.params
+    expected_args = frozenset(argnames)
+    cache_key = tuple(argnames)
     argvalues = []
     for p in params:
-        # check the param.kwargs exactly match the required argnames
-        expected_args = set(argnames)
-        passed_kwargs = set(p.kwargs.keys())
-        if missing := expected_args.difference(passed_kwargs):
-            raise TypeError(f"Param with id={p.id!r} is missing these kwargs: {sorted(missing)}")
-        if unexpected := passed_kwargs.difference(expected_args):
-            raise TypeError(
-                f"Param with id={p.id!r} received unexpected kwargs: {sorted(unexpected)}"
-            )
-
-        # Get the positional args in the correct order (matching the order of argnames)
-        values = [p.kwargs.get(n) for n in argnames]
-        arg_value = pytest.param(*values, marks=p.marks, id=p.id)
+        values = p._values_cache.get(cache_key)
+        if values is None:
+            # check the param.kwargs exactly match the required argnames
+            passed_kwargs = p.kwargs.keys()  # a set-like view, so no need to build a set
+            if missing := expected_args - passed_kwargs:
+                raise TypeError(
+                    f"Param with id={p.id!r} is missing these kwargs: {sorted(missing)}"
+                )
+            if unexpected := passed_kwargs - expected_args:
+                raise TypeError(
+                    f"Param with id={p.id!r} received unexpected kwargs: {sorted(unexpected)}"
+                )
+
+            # Get the positional args in the correct order (matching the order of argnames)
+            values = p._values_cache[cache_key] = get_values(p.kwargs)
+
+        if p.marks:
+            arg_value = pytest.param(*values, marks=p.marks, id=p.id)
+        else:
+            arg_value = pytest.param(*values, id=p.id)  # skip pytest's marks handling
         argvalues.append(arg_value)
     return pytest.mark.parametrize(argnames, argvalues, **kwargs)
 
@@ -74,10 +117,17 @@ def set_difference(a, b):
     diff = set_difference(serializer.data.keys(), expected_keys)
     assert not diff  # if they are different, the error message will tell you exactly how
     """
-    a = set(a)
-    b = set(b)
-    difference = {*(a - b), *(b - a)}
-    return difference
+    return set(a).symmetric_difference(b)
+
+
+def sets_differ(a, b) -> bool:
+    """Whether two collections contain different sets of values. Cheaper than
+    `bool(set_difference(a, b))` because set equality can stop at the first mismatch.
+    E.g.
+
+    assert not sets_differ(serializer.data.keys(), expected_keys)
+    """
+    return set(a) != set(b)
 
 
 def assert_dicts_equal(a: dict, b: dict):
@@ -88,24 +138,46 @@ def assert_dicts_equal(a: dict, b: dict):
     Suggested usage:
     `assert_dicts_equal(serializer.data, expected_data)`
     """
-    # If they're equal we don't need to waste time with anything fancy
-    if a == b:
-        return
-
-    keys_diff = set_difference(a.keys(), b.keys())
-    assert not keys_diff, f"These keys are not present in both dictionaries: {sorted(keys_diff)}"
-    for key, a_value in a.items():
-        b_value = b[key]
-        if isinstance(a_value, dict) and isinstance(b_value, dict):
-            assert_dicts_equal(a_value, b_value)
-        else:
+    # Nested dicts are handled with a stack of iterators instead of recursion, to avoid the
+    # function call overhead for every level of nesting. A nested pair is descended into as soon as
+    # it is found, so mismatches are reported in the same (depth-first) order as with recursion.
+    stack = []
+    nested = (a, b)
+    while nested is not None or stack:
+        if nested is not None:
+            a, b = nested
+            nested = None
+
+            # If they're equal we don't need to waste time with anything fancy. Checking identity
+            # first saves walking the whole dict when the same object is passed twice.
+            if a is b or a == b:
+                continue
+
+            # comparing the key views doesn't need to build any sets; only work out the difference
+            # if we need it for the error message.
+            if a.keys() != b.keys():
+                keys_diff = a.keys() ^ b.keys()
+                raise AssertionError(
+                    f"These keys are not present in both dictionaries: {sorted(keys_diff)}"
+                )
+            stack.append((iter(a.items()), b))
+
+        items, b = stack[-1]
+        for key, a_value in items:
+            b_value = b[key]
+            if a_value is b_value:
+                continue  # same object, so nothing to compare (and no need to look inside it)
+            if isinstance(a_value, dict) and isinstance(b_value, dict):
+                nested = (a_value, b_value)
+                break  # finish the nested pair before coming back for the rest of these items
             # if either of the values is a boolean, use `a is b` instead of `a == b`.
             # (because `1 == True` and `0 == False` in python!)
-            func = (
-                operator.is_
-                if (isinstance(a_value, bool) or isinstance(b_value, bool))
-                else operator.eq
-            )
-            assert func(
-                a_value, b_value
-            ), f"Values don't match for key '{key}': {b_value} != {a_value}"
+            # bool can't be subclassed, so an exact type check is enough here.
+            involves_bool = type(a_value) is bool or type(b_value) is bool
+            if not involves_bool and a_value == b_value:
+                continue  # the common case; no need to go through operator functions
+            func = _IS if involves_bool else _EQ
+            if not func(a_value, b_value):
+                raise AssertionError(f"Values don't match for key '{key}': {b_value} != {a_value}")
+        else:
+            stack.pop()
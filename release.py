@@ -1,15 +1,20 @@
+import glob
 import shutil
 import subprocess
 from pathlib import Path
 
+_HERE = Path(__file__).parent
+
 
 def cleanup():
-    for folder in [Path(__file__).parent / "redbreast.egg-info", Path(__file__).parent / "dist"]:
+    for folder in [_HERE / "redbreast.egg-info", _HERE / "dist"]:
         if folder.exists():
             shutil.rmtree(folder)
 
 
 cleanup()
-subprocess.run("python -m build".split())
-subprocess.run("twine upload dist/*".split())
+# These have to run one after the other, and check=True stops us uploading a broken build.
+# subprocess doesn't expand "dist/*" like a shell would, so we glob the files ourselves.
+subprocess.run(("python", "-m", "build"), cwd=_HERE, check=True)
+subprocess.run(("twine", "upload", *glob.glob(str(_HERE / "dist" / "*"))), cwd=_HERE, check=True)
 cleanup()
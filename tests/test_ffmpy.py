@@ -1,9 +1,11 @@
+import sys
+from contextlib import nullcontext
 from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
 
-from redbreast.ffmpy import cli
+from redbreast.ffmpy import api, argparse_cli, cli
 from redbreast.ffmpy.api import FfmpegError
 
 runner = CliRunner()
@@ -44,3 +46,204 @@ def test_cli_no_errors(func, cmd):
         mock.return_value = "some/file.mp4"
         result = runner.invoke(cli.app, cmd.split())
         assert result.exit_code == 0
+
+
+def test_to_mp4_passes_paths_with_spaces_as_single_arguments(tmp_path):
+    input_file = tmp_path / "my video.mkv"
+    input_file.touch()
+    with patch("redbreast.ffmpy.api._run_ffmpeg") as mock:
+        output_file = api.to_mp4(input_file.as_posix())
+
+    args = mock.call_args.args[0]
+    assert input_file.as_posix() in args
+    assert args[-1] == output_file == (tmp_path / "my video.mp4").as_posix()
+
+
+def _fake_ffmpeg(stderr: bytes, returncode: int) -> list[str]:
+    """Args for a child process that writes `stderr` and exits with `returncode`"""
+    code = f"import sys; sys.stderr.buffer.write({stderr!r}); sys.exit({returncode})"
+    return [sys.executable, "-c", code]
+
+
+def test_ffmpeg_error_contains_stderr(capfd):
+    with pytest.raises(FfmpegError) as e:
+        api._run_ffmpeg(_fake_ffmpeg(b"arghh", returncode=1))
+    assert str(e.value) == "arghh"
+    assert capfd.readouterr().err == "arghh"  # ffmpeg's output still reaches the terminal
+
+
+def test_ffmpeg_error_only_keeps_end_of_stderr():
+    stderr = b"x" * api.STDERR_TAIL_SIZE + b"arghh"
+    with pytest.raises(FfmpegError) as e:
+        api._run_ffmpeg(_fake_ffmpeg(stderr, returncode=1))
+    assert len(str(e.value)) == api.STDERR_TAIL_SIZE
+    assert str(e.value).endswith("arghh")
+
+
+def test_ffmpeg_stderr_does_not_have_to_be_utf8():
+    api._run_ffmpeg(_fake_ffmpeg(b"caf\xe9", returncode=0))  # no UnicodeDecodeError
+    with pytest.raises(FfmpegError) as e:
+        api._run_ffmpeg(_fake_ffmpeg(b"caf\xe9", returncode=1))
+    assert str(e.value) == "caf\ufffd"
+
+
+@pytest.mark.parametrize("fast_start", [True, False])
+def test_fast_start_args_go_before_input(tmp_path, fast_start):
+    input_file = tmp_path / "video.mkv"
+    input_file.touch()
+    with patch("redbreast.ffmpy.api._run_ffmpeg") as mock:
+        api.to_mp4(input_file.as_posix(), fast_start=fast_start)
+
+    args = mock.call_args.args[0]
+    if fast_start:
+        assert "-probesize" in args
+        assert args.index("-probesize") < args.index("-i")
+    else:
+        assert "-probesize" not in args
+
+
+def test_timelapse_cli_passes_preset():
+    with patch("redbreast.ffmpy.cli.api.create_timelapse") as mock:
+        mock.return_value = "some/file.mp4"
+        result = runner.invoke(cli.app, "timelapse -i /foo/bar -ifps 30 -p veryslow".split())
+    assert result.exit_code == 0
+    assert mock.call_args.kwargs["preset"] == "veryslow"
+
+
+def test_batch_to_mp4_preserves_input_order():
+    with patch("redbreast.ffmpy.api.to_mp4", side_effect=lambda path, **kwargs: path + ".mp4"):
+        assert api.batch_to_mp4(["a", "b", "c"], max_workers=2) == ["a.mp4", "b.mp4", "c.mp4"]
+
+
+def test_batch_to_mp4_rejects_inputs_with_the_same_output():
+    with patch("redbreast.ffmpy.api.to_mp4") as mock:
+        with pytest.raises(ValueError) as e:
+            api.batch_to_mp4(["a.mkv", "b.mkv", "a.avi"])
+    mock.assert_not_called()
+    assert str(e.value) == "These inputs would be converted to the same file: a.mkv, a.avi"
+
+
+def test_batch_to_mp4_reports_every_failed_input():
+    def fake_to_mp4(path, **kwargs):
+        if path == "b.mkv":
+            return "b.mp4"
+        raise FfmpegError(f"arghh {path}")
+
+    with patch("redbreast.ffmpy.api.to_mp4", side_effect=fake_to_mp4) as mock:
+        with pytest.raises(api.BatchError) as e:
+            api.batch_to_mp4(["a.mkv", "b.mkv", "c.mkv"], max_workers=2)
+    assert mock.call_count == 3  # one failure doesn't stop the other jobs
+    assert list(e.value.errors) == ["a.mkv", "c.mkv"]
+    assert str(e.value) == (
+        "Failed to convert 2 file(s):\n"
+        "a.mkv: FfmpegError: arghh a.mkv\n"
+        "c.mkv: FfmpegError: arghh c.mkv"
+    )
+
+
+def test_to_mp4_cli_with_multiple_files_uses_batch():
+    with patch("redbreast.ffmpy.cli.api.batch_to_mp4") as mock:
+        mock.return_value = ["a.mp4", "b.mp4"]
+        result = runner.invoke(cli.app, "to-mp4 -i a.mkv -i b.mkv -w 2".split())
+    assert result.exit_code == 0
+    assert mock.call_args.args[0] == ["a.mkv", "b.mkv"]
+    assert mock.call_args.kwargs["max_workers"] == 2
+    assert "Created file: a.mp4" in result.stdout
+    assert "Created file: b.mp4" in result.stdout
+
+
+@pytest.mark.parametrize(
+    "mode, expected_input_args, expected_output_args",
+    [
+        ("filter", [], ["-vf", "framestep=10,setpts=N/30/TB"]),
+        ("select", [], ["-vf", "select='not(mod(n,10))',setpts=N/30/TB", "-vsync", "vfr"]),
+        ("keyframe", ["-skip_frame", "nokey"], ["-vf", "setpts=N/30/TB", "-vsync", "vfr"]),
+    ],
+)
+def test_frame_sampling_args(mode, expected_input_args, expected_output_args):
+    input_args, output_args = api._frame_sampling_args(mode, step=10, input_fps=30)
+    assert input_args == expected_input_args
+    assert output_args == expected_output_args
+
+
+def test_frame_sampling_args_unknown_mode():
+    with pytest.raises(ValueError):
+        api._frame_sampling_args("foo", step=10, input_fps=30)
+
+
+def test_resolve_file_makes_paths_absolute(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "-clip.mkv").touch()
+    assert api._resolve_file("-clip.mkv") == tmp_path / "-clip.mkv"
+
+    with patch("redbreast.ffmpy.api._run_ffmpeg") as mock:
+        output_file = api.to_mp4("./-clip.mkv")
+    args = mock.call_args.args[0]
+    assert output_file == args[-1] == (tmp_path / "-clip.mp4").as_posix()
+    assert not any(arg.startswith("-") for arg in args if arg.endswith((".mkv", ".mp4")))
+
+
+def test_resolve_file(tmp_path):
+    file = tmp_path / "video.mkv"
+    file.touch()
+    assert api._resolve_file(file.as_posix()) == file
+
+    with pytest.raises(FileNotFoundError):
+        api._resolve_file((tmp_path / "nope.mkv").as_posix())
+
+    with pytest.raises(FileNotFoundError):
+        api._resolve_file(tmp_path.as_posix())  # directories don't count
+
+    with pytest.raises(FileNotFoundError):
+        api._resolve_file((file / "nope.mkv").as_posix())  # a file can't contain other files
+
+
+@pytest.mark.parametrize(
+    "func, cmd",
+    [
+        ("redbreast.ffmpy.argparse_cli.api.to_mp4", "to-mp4 -i /foo/bar"),
+        ("redbreast.ffmpy.argparse_cli.api.create_timelapse", "timelapse -i /foo/bar -ifps 30"),
+    ],
+)
+@pytest.mark.parametrize(
+    "exception, expected_stdout",
+    [
+        (None, "Created file: some/file.mp4"),
+        (FileNotFoundError("some/file"), "File not found: some/file"),
+        (FfmpegError("arghh"), "ffmpeg gave an error: arghh"),
+        (Exception("HELP"), "Exception: HELP"),
+        (api.BatchError({"a.mkv": FfmpegError("arghh")}), "Failed to convert 1 file(s):"),
+    ],
+)
+def test_argparse_cli(exception, expected_stdout, func, cmd, capsys):
+    with patch(func) as mock:
+        mock.return_value = "some/file.mp4"
+        mock.side_effect = exception
+        exit_code = argparse_cli.main(cmd.split())
+    assert capsys.readouterr().out.startswith(expected_stdout)
+    assert exit_code == (1 if exception else 0)
+
+
+def test_argparse_cli_rejects_small_step(capsys):
+    with pytest.raises(SystemExit):
+        argparse_cli.main("timelapse -i /foo/bar -ifps 30 -s 1".split())
+    error = capsys.readouterr().err
+    assert "ffmpy timelapse: error: argument --step/-s: must be at least 2" in error
+
+
+@pytest.mark.parametrize("env_value, uses_typer", [(None, False), ("0", False), ("1", True)])
+def test_main_only_uses_typer_when_asked(env_value, uses_typer, monkeypatch):
+    from redbreast.ffmpy import __main__
+
+    if env_value is None:
+        monkeypatch.delenv("FFMPY_TYPER", raising=False)
+    else:
+        monkeypatch.setenv("FFMPY_TYPER", env_value)
+    with (
+        patch("redbreast.ffmpy.cli.app") as typer_app,
+        patch("redbreast.ffmpy.argparse_cli.main", return_value=0) as argparse_main,
+        pytest.raises(SystemExit) if not uses_typer else nullcontext(),
+    ):
+        __main__.main()
+    assert typer_app.called == uses_typer
+    assert argparse_main.called != uses_typer
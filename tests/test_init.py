@@ -0,0 +1,16 @@
+import subprocess
+import sys
+
+import redbreast
+
+
+def test_lazy_exports():
+    assert redbreast.param is redbreast.testing.param
+    assert redbreast.parametrize is redbreast.testing.parametrize
+    assert {"param", "parametrize", "testing", "querylist"} <= set(dir(redbreast))
+
+
+def test_submodules_accessible_without_explicit_import():
+    # run in a fresh interpreter, so that no other test has imported the submodules already
+    code = "import redbreast; redbreast.testing.assert_dicts_equal({}, {}); redbreast.querylist"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -52,6 +52,22 @@ def test__map_operation(input_key, expected_key, expected_operation):
     assert operation == expected_operation
 
 
+@pytest.mark.parametrize(
+    "query, expected_chain, expected_operation",
+    [
+        ("name", ((None, "name"),), operator.eq),
+        ("name__lt", ((None, "name"),), operator.lt),
+        ("name__bool", ((None, "name"), (bool, "bool")), operator.eq),
+        ("name__len__gte", ((None, "name"), (len, "len")), operator.ge),
+        ("friend__friend__name", ((None, "friend"), (None, "friend"), (None, "name")), operator.eq),
+    ],
+)
+def test__compile_query(query, expected_chain, expected_operation):
+    chain, operation = QueryList._compile_query(query)
+    assert chain == expected_chain
+    assert operation == expected_operation
+
+
 def test_all():
     list_instance = [1, 2, 3]
     qs = QueryList(list_instance)
@@ -64,6 +80,11 @@ def test_all():
     assert second_list_instance is not list_instance
 
 
+def test_all_does_not_copy_items():
+    qs = _default()
+    assert all(a is b for a, b in zip(qs.all(), qs))
+
+
 def test_first():
     qs = _default()
     assert qs.first() == fido
@@ -93,6 +114,13 @@ def test_get():
         qs.get("foo")
 
 
+def test_get_stops_looking_after_second_match():
+    # the last item would raise an AttributeError if get() went on to inspect it
+    qs = QueryList([dict(name="foo"), dict(name="foo"), object()])
+    with pytest.raises(MultipleObjectsReturned):
+        qs.get(name="foo")
+
+
 def test_unknown_dunder_operation_raises_exception():
     ql = _default()
     with pytest.raises(AttributeError) as e:
@@ -160,6 +188,9 @@ def test__match_item(filter_kwargs, expected_match):
         (dict(name__in=["foo"]), False),
         (dict(name__in=["foo", "Fido"]), True),
         (dict(name__in="Fido"), True),
+        (dict(name__in=("foo", "Fido")), True),
+        (dict(name__in=["foo", ["unhashable"]]), False),
+        (dict(name__in=["Fido", ["unhashable"]]), True),
         (dict(name__len=4), True),
         (dict(name__len=69), False),
     ],
@@ -281,6 +312,20 @@ def test_filter_and_exclude(apply_filter, expected_result):
     assert result == expected_result
 
 
+def test_filter_many():
+    qs = _default()
+    sams, robins, long_names = qs.filter_many(
+        dict(owner="Sam"),
+        dict(owner="Robin"),
+        dict(name__len__gt=4),
+    )
+    assert sams == qs.filter(owner="Sam") == [fido, biko]
+    assert robins == qs.filter(owner="Robin") == [muttley, buster]
+    assert long_names == qs.filter(name__len__gt=4) == [muttley, buster]
+    assert all(isinstance(result, QueryList) for result in (sams, robins, long_names))
+    assert qs.filter_many() == []
+
+
 def test_filter_for_nonexistent_attribute_raises_error():
     qs = _default()
     with pytest.raises(AttributeError):
@@ -291,6 +336,21 @@ def test_filter_for_nonexistent_attribute_raises_error():
         qs.filter(energy=9000)
 
 
+def test_in_with_unhashable_attribute():
+    ql = QueryList([dict(tags=["a"]), dict(tags=["b"])])
+    assert ql.filter(tags__in=[["a"], ("b",)]) == [dict(tags=["a"])]
+
+
+def test_in_with_incompatible_target_still_raises():
+    ql = QueryList([dict(n=1)])
+    with pytest.raises(TypeError):
+        ql.filter(n__in="abc")
+
+    ql = QueryList([dict(tags=["a"])])
+    with pytest.raises(TypeError):
+        ql.filter(tags__in={"a": 1})  # unhashable value against a dict target
+
+
 def test_filter_works_on_dicts_too():
     dogs = QueryList(
         [
@@ -367,6 +427,67 @@ def test_register_operation_and_attribute_getter():
     assert "num_fs" not in dict(QueryList.attribute_getters)
 
 
+def test_register_attribute_getter_invalidates_cached_chains():
+    class _QueryList(QueryList):
+        attribute_getters = QueryList.attribute_getters
+
+    ql = _QueryList([dict(thing=dict(size=5))])
+    assert ql.filter(thing__size=5).exists()  # caches "size" as a plain key lookup...
+
+    _QueryList.register_attribute_getter("size", len)
+    assert ql.filter(thing__size=1).exists()  # ...which must now use the getter instead
+
+
+def test_register_operation_invalidates_cached_queries():
+    class _QueryList(QueryList):
+        operations = QueryList.operations
+
+    ql = _QueryList([dict(thing=dict(big=True))])
+    assert ql.filter(thing__big=True).exists()  # caches "big" as a plain key lookup...
+
+    _QueryList.register_operation("big", lambda item, size: len(item) > size)
+    assert ql.filter(thing__big=0).exists()  # ...which must now be an operation instead
+
+
+def test_registries_can_be_reassigned(monkeypatch):
+    class _QueryList(QueryList):
+        pass
+
+    ql = _QueryList([dict(thing=dict(size=5, x=1))])
+    assert ql.filter(thing__size=5).exists()  # "size" is a plain key lookup...
+
+    _QueryList.attribute_getters = QueryList.attribute_getters + (("size", len),)
+    assert ql.filter(thing__size=2).exists()  # ...until the registry is replaced
+
+    monkeypatch.setattr(
+        _QueryList, "operations", QueryList.operations + (("big", lambda a, b: len(a) > b),)
+    )
+    assert ql.filter(thing__big=1).exists()
+    assert "big" not in dict(QueryList.operations)
+
+
+def test_registered_functions_do_not_have_to_be_hashable():
+    @dataclass
+    class LongerThan:  # dataclasses with eq=True (the default) are unhashable
+        def __call__(self, item, target_len):
+            return len(item) > target_len
+
+    @dataclass
+    class CountFs:
+        def __call__(self, item):
+            return item.count("f")
+
+    class _QueryList(QueryList):
+        pass
+
+    _QueryList.register_operation("islongerthan", LongerThan())
+    _QueryList.register_attribute_getter("num_fs", CountFs())
+    ql = _QueryList([dict(name="abc"), dict(name="ffff")])
+    assert ql.filter(name="abc") == [dict(name="abc")]
+    assert ql.filter(name__islongerthan=3) == [dict(name="ffff")]
+    assert ql.filter(name__num_fs=4) == [dict(name="ffff")]
+
+
 @redbreast.parametrize(
     "order_by, expected_result",
     [
@@ -499,6 +620,26 @@ def test_order_by(order_by, expected_result):
     assert isinstance(results, QueryList)
 
 
+@pytest.mark.parametrize("order_by", [("a", "b"), ("-a", "-b"), ("a", "-b"), ("-a", "b")])
+def test_order_by_only_compares_later_fields_on_ties(order_by):
+    # comparing None with an int would raise a TypeError, but "b" never needs comparing here
+    ql = QueryList([dict(a=1, b=None), dict(a=2, b=3)])
+    expected = list(ql) if order_by[0] == "a" else list(reversed(ql))
+    assert ql.order_by(*order_by) == expected
+
+
+def test_order_by_mixed_directions_keeps_ties_in_order():
+    ql = QueryList(
+        [
+            dict(name="c", a=1, b=1),
+            dict(name="a", a=1, b=2),
+            dict(name="b", a=1, b=2),
+            dict(name="d", a=0, b=1),
+        ]
+    )
+    assert [item["name"] for item in ql.order_by("-a", "b")] == ["c", "a", "b", "d"]
+
+
 @pytest.mark.parametrize(
     "attribute_string, expected_result",
     [
@@ -535,3 +676,13 @@ def test__recursive_get_attribute_fail():
     doggie["friend"] = dict(name="Friend", owner="Someone else", number=420)
     with pytest.raises(KeyError):
         QueryList._recursive_get_attribute(doggie, "friend__foo")
+
+
+def test__get_attribute_can_be_overridden():
+    class _QueryList(QueryList):
+        @classmethod
+        def _get_attribute(cls, item, attribute):
+            return item.get(attribute) if isinstance(item, dict) else getattr(item, attribute, None)
+
+    ql = _QueryList([dict(name="Fido"), dict(owner="Sam")])
+    assert ql.filter(name=None) == [dict(owner="Sam")]
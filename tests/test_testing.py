@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -6,6 +8,7 @@ import redbreast
 from redbreast.testing import (
     assert_dicts_equal,
     set_difference,
+    sets_differ,
 )
 
 
@@ -14,7 +17,10 @@ from redbreast.testing import (
     [
         "a, b",
         "a,b",
+        "a,  b",
+        " a ,b ",
         ["a", "b"],
+        ("a", "b"),
     ],
 )
 def test_parametrize_handles_different_argnames_formats(argnames_format):
@@ -31,6 +37,51 @@ def test_parametrize_handles_different_argnames_formats(argnames_format):
         mock.assert_called_with(["a", "b"], expected_pytest_params)
 
 
+def test_param_id_is_interned():
+    description = "".join(["some ", "long ", "description"])  # not interned by the compiler
+    assert redbreast.param(id=description).id is redbreast.param(id=description).id
+    assert redbreast.param(id=None).id is None
+
+
+def test_param_has_no_instance_dict():
+    p = redbreast.param(id="first", a=1)
+    assert not hasattr(p, "__dict__")
+    assert p.kwargs == {"a": 1}
+
+
+def test_parametrize_reuses_param():
+    shared = redbreast.param(id="shared", a=1, b=2)
+    with patch("redbreast.testing.pytest.mark.parametrize", return_value="boo") as mock:
+        redbreast.parametrize("a, b", [shared])
+        mock.assert_called_with(["a", "b"], [pytest.param(1, 2, id="shared")])
+        redbreast.parametrize("b, a", [shared])  # different order, so a different cache entry
+        mock.assert_called_with(["b", "a"], [pytest.param(2, 1, id="shared")])
+        redbreast.parametrize("a, b", [shared])
+        mock.assert_called_with(["a", "b"], [pytest.param(1, 2, id="shared")])
+
+    with pytest.raises(TypeError):
+        redbreast.parametrize("a", [shared])  # validation still applies to new argnames
+
+
+def test_parametrize_passes_marks():
+    mark = pytest.mark.skip(reason="because")
+    with patch("redbreast.testing.pytest.mark.parametrize", return_value="boo") as mock:
+        redbreast.parametrize("a", [redbreast.param(id="first", a=1, marks=(mark,))])
+        mock.assert_called_with(["a"], [pytest.param(1, id="first", marks=(mark,))])
+
+
+def test_parametrize_single_argname():
+    with patch("redbreast.testing.pytest.mark.parametrize", return_value="boo") as mock:
+        redbreast.parametrize("a", [redbreast.param(id="first", a=(1, 2))])
+        mock.assert_called_with(["a"], [pytest.param((1, 2), id="first")])
+
+
+def test_parametrize_no_argnames():
+    with patch("redbreast.testing.pytest.mark.parametrize", return_value="boo") as mock:
+        redbreast.parametrize([], [redbreast.param(id="first")])
+        mock.assert_called_with([], [pytest.param(id="first")])
+
+
 @pytest.mark.parametrize(
     "input_param, expected_error_msg",
     [
@@ -178,6 +229,10 @@ def test_parametrize_demo_usage(
 )
 def test_set_difference(values, expected_values, expected_diff):
     assert set_difference(values, expected_values) == expected_diff
+    assert sets_differ(values, expected_values) == bool(expected_diff)
+
+
+SHARED_DICT = {"foo": {"bar": [1, 2, 3]}}
 
 
 @pytest.mark.parametrize(
@@ -187,6 +242,7 @@ def test_set_difference(values, expected_values, expected_diff):
         ({"foo": "foo"}, {"foo": "foo"}),
         ({"foo": "foo", "bar": "bar"}, {"bar": "bar", "foo": "foo"}),
         ({"foo": 3}, {"foo": 3.0}),  # based on equality, not on type
+        (SHARED_DICT, SHARED_DICT),
     ],
 )
 def test_assert_dicts_equal_match(a, b):
@@ -216,14 +272,44 @@ def test_assert_dicts_equal_match(a, b):
             {"foo": "foo", "bar": {"nested": "dict", "extra": "stuff"}},
             f"These keys are not present in both dictionaries: {['extra']}",
         ),
+        (
+            {"foo": 1, "bar": "bar"},
+            {"foo": True, "bar": "bbbbbbbbbbbbbbbb"},
+            "Values don't match for key 'foo': True != 1",
+        ),
+        (
+            {"foo": {"bar": {"baz": "dict"}}},
+            {"foo": {"bar": {"baz": "bbbbbbbbbbbbbbbb"}}},
+            "Values don't match for key 'baz': bbbbbbbbbbbbbbbb != dict",
+        ),
         (
             {"foo": "foo", "bar": {"nested": "dict"}},
             {"foo": "foo", "bar": "just a string"},
             "Values don't match for key 'bar': just a string != {'nested': 'dict'}",
         ),
+        (
+            {"a": {"x": 1}, "b": 2},
+            {"a": {"x": 9}, "b": 3},
+            "Values don't match for key 'x': 9 != 1",
+        ),
     ],
 )
 def test_assert_dicts_equal_mismatch(a, b, error_message):
     with pytest.raises(AssertionError) as e:
         assert_dicts_equal(a, b)
     assert e.value.args[0] == error_message
+
+
+def test_assert_dicts_equal_mismatch_with_optimisations():
+    # python -O strips assert statements, so make sure the mismatches are still reported
+    code = (
+        "from redbreast.testing import assert_dicts_equal\n"
+        "for a, b in [({'a': 1}, {'b': 1}), ({'a': 1}, {'a': 2})]:\n"
+        "    try:\n"
+        "        assert_dicts_equal(a, b)\n"
+        "    except AssertionError:\n"
+        "        pass\n"
+        "    else:\n"
+        "        raise SystemExit(f'no error for {a} and {b}')\n"
+    )
+    subprocess.run([sys.executable, "-O", "-c", code], check=True)